@@ -4,38 +4,42 @@ import os
 from datetime import datetime
 
 import pandas as pd
-from dotenv import load_dotenv
+from src.config.env import load_env
 
 from src.classification import LLMClassifier
 from src.config.database import SupabaseDB
+from src.http_client import close_session
 from src.scraper.telegram_scrap import TelegramScraper
 from src.logger import get_logger
-from src.notification import send_dataframe_to_telegram, send_notify_telegram, send_error_to_telegram
+from src.notification import (send_dataframe_to_telegram, send_notify_telegram, send_error_to_telegram,
+                              flush_error_notifications)
 from src.utils import scrape_all_sources
 
-load_dotenv()
+load_env()
 logger = get_logger("Main")
 
 
 async def main():
 
-    session_name = os.getenv("TELEGRAM_SESSION_NAME", "telegram_session")
-    session_file = f"{session_name}.session"
-    if not os.path.exists(session_file):
-        error_msg = f"❌ File session '{session_file}' not found. \nManual login is required once in an interactive environment."
-        logger.error(error_msg)
-        await send_error_to_telegram(error_msg)
-        raise RuntimeError(error_msg)
-
-    # Database Init
-    db = SupabaseDB()
-    await db.initialize()
-
-    # Telegram Init
-    tg_scraper = TelegramScraper()
-    client = await tg_scraper.login()
-
+    db = None
+    tg_scraper = None
     try:
+        session_name = os.getenv("TELEGRAM_SESSION_NAME", "telegram_session")
+        session_file = f"{session_name}.session"
+        if not os.path.exists(session_file):
+            error_msg = f"❌ File session '{session_file}' not found. \nManual login is required once in an interactive environment."
+            logger.error(error_msg)
+            await send_error_to_telegram(error_msg)
+            raise RuntimeError(error_msg)
+
+        # Database Init
+        db = SupabaseDB()
+        await db.initialize()
+
+        # Telegram Init
+        tg_scraper = TelegramScraper()
+        client = await tg_scraper.login()
+
         dt = await db.get_all_sources()
 
         dt = pd.DataFrame(data=dt)
@@ -82,9 +86,9 @@ async def main():
             f.write(json_output)
 
         # Log Summery
-        total_pulled = sum(log["pulled"] for log in run_stats)
-        total_kept = sum(log["kept"] for log in run_stats)
-        logger.info(f"📊 [TOTAL]  Pulled: {total_pulled} | Kept: {total_kept}")
+        total_pulled = sum(log.pulled for log in run_stats)
+        total_kept = sum(log.kept for log in run_stats)
+        logger.info("📊 [TOTAL]  Pulled: %d | Kept: %d", total_pulled, total_kept)
         await send_notify_telegram(f"📊 [TOTAL] Pulled: {total_pulled} | Kept: {total_kept}")
         await send_dataframe_to_telegram(df_merged, today)
 
@@ -95,8 +99,12 @@ async def main():
             logger.warning("⚠️ No scraping stats collected.")
 
     finally:
-        await db.close()
-        await tg_scraper.close()
+        if db is not None:
+            await db.close()
+        if tg_scraper is not None:
+            await tg_scraper.close()
+        await flush_error_notifications()
+        await close_session()
 
 
 if __name__ == "__main__":
@@ -3,12 +3,12 @@ import asyncio
 import json
 import pandas as pd
 from openai import AsyncOpenAI
-from dotenv import load_dotenv
+from src.config.env import load_env
 
 from src.logger import get_logger
 from src.notification import send_error_to_telegram, send_notify_telegram
 
-load_dotenv()
+load_env()
 
 
 class LLMClassifier:
@@ -151,7 +151,7 @@ EXAMPLE JSON OUTPUT:
             async with semaphore:
                 result = await self._classify_batch(batch)
                 results.extend(result)
-                self.logger.info(f"✅ Batch completed: {len(result)} items classified")
+                self.logger.info("✅ Batch completed: %d items classified", len(result))
 
         tasks = [_process_batch(batch) for batch in batches]
         await asyncio.gather(*tasks)
@@ -161,5 +161,5 @@ EXAMPLE JSON OUTPUT:
 
         if "keep" in result_df.columns:
             result_df = result_df.drop(columns=["keep"])
-        self.logger.info(f"✅ Classification completed. Total: {len(result_df)} items.")
+        self.logger.info("✅ Classification completed. Total: %d items.", len(result_df))
         return result_df
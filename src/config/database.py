@@ -1,44 +1,90 @@
 import asyncio
 import os
 import asyncpg
+from operator import attrgetter
 from typing import List, Dict, Any, Optional
-from dotenv import load_dotenv
+from src.config.env import load_env
 from src.logger import get_logger
 from src.notification import send_error_to_telegram
 from src.types import ScrapeStats
 
-load_dotenv()
+load_env()
 logger = get_logger(__name__)
 
+# Batches at least this large are written with COPY instead of UNNEST
+COPY_THRESHOLD = 50
+
+INSERT_LOG_RUNS_SQL = """
+    INSERT INTO logs_runs (channel_id, pulled, kept, platform)
+    SELECT * FROM unnest($1::text[], $2::int[], $3::int[], $4::text[])
+"""
+
+# Column order of a logs_runs record
+_LOG_COLS = attrgetter("channel_id", "pulled", "kept", "platform")
+
+
+def _to_record(log: ScrapeStats) -> tuple:
+    """Build a logs_runs row with the exact types asyncpg encodes for text/int columns."""
+    channel_id, pulled, kept, platform = _LOG_COLS(log)
+    return (
+        None if channel_id is None else str(channel_id),
+        int(pulled),
+        int(kept),
+        None if platform is None else str(platform)
+    )
+
+
 class SupabaseDB:
-    def __init__(self, database_url: Optional[str] = None, min_size: int = 1, max_size: int = 5):
+    def __init__(self,
+                 database_url: Optional[str] = None,
+                 min_size: int = 2,
+                 max_size: int = 10,
+                 max_inactive_connection_lifetime: float = 300.0):
         self.database_url = database_url or os.getenv("DATABASE_URL")
         if not self.database_url:
             raise ValueError("DATABASE_URL environment variable must be set.")
         self.min_size = min_size
         self.max_size = max_size
+        self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
         self._pool: Optional[asyncpg.Pool] = None
+        self._pool_lock = asyncio.Lock()
+        self._closed = False
 
     async def initialize(self) -> None:
         """Initialize the connection pool."""
+        async with self._pool_lock:
+            if self._closed:
+                raise RuntimeError("Database pool is closed. Create a new SupabaseDB to reconnect.")
+            # Re-check under the lock so concurrent callers build only one pool
+            if self._pool is None:
+                try:
+                    self._pool = await asyncpg.create_pool(
+                        dsn=self.database_url,
+                        statement_cache_size=0,
+                        min_size=self.min_size,
+                        max_size=self.max_size,
+                        max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+                        timeout=60,
+                        command_timeout=30
+                    )
+                    logger.info("✅ Database connection pool initialized.")
+                except Exception as e:
+                    logger.error("❌ Failed to initialize database pool: %s", e)
+                    await send_error_to_telegram(f"❌ DB Pool Init Failed: {e}")
+                    raise
+
+    async def get_pool(self) -> asyncpg.Pool:
+        """Return the shared connection pool, initializing it on first use."""
+        if self._closed:
+            raise RuntimeError("Database pool is closed. Create a new SupabaseDB to reconnect.")
         if self._pool is None:
-            try:
-                self._pool = await asyncpg.create_pool(
-                    dsn=self.database_url,
-                    statement_cache_size=0,
-                    min_size=self.min_size,
-                    max_size=self.max_size,
-                    timeout=60,
-                    command_timeout=30
-                )
-                logger.info("✅ Database connection pool initialized.")
-            except Exception as e:
-                logger.error(f"❌ Failed to initialize database pool: {e}")
-                await send_error_to_telegram(f"❌ DB Pool Init Failed: {e}")
-                raise
+            await self.initialize()
+        return self._pool
 
     async def close(self) -> None:
         """Gracefully close the connection pool with timeout."""
+        # Late callers must not lazily reopen a pool nobody will close
+        self._closed = True
         if self._pool:
             try:
 
@@ -53,15 +99,12 @@ class SupabaseDB:
 
     async def get_all_sources(self) -> List[Dict[str, Any]]:
         """Fetch all records from the 'sources' table."""
-        if self._pool is None:
-            raise RuntimeError("Database pool not initialized. Call .initialize() first.")
-
         try:
-            async with self._pool.acquire() as conn:
+            async with (await self.get_pool()).acquire() as conn:
                 rows = await conn.fetch("SELECT id, channel_id, platform, channel_name FROM sources")
                 return [dict(row) for row in rows]
         except Exception as e:
-            logger.error(f"❌ Failed to fetch sources: {e}")
+            logger.error("❌ Failed to fetch sources: %s", e)
             await send_error_to_telegram(f"❌ DB: Failed to fetch sources: {e}")
             raise
 
@@ -69,29 +112,29 @@ class SupabaseDB:
         """Insert multiple log entries into 'logs_runs' table."""
         if not logs:
             return
-        if self._pool is None:
-            raise RuntimeError("Database pool not initialized. Call .initialize() first.")
 
         try:
-            async with self._pool.acquire() as conn:
-                records = [
-                    (
-                        log.get("channel_id"),
-                        log["pulled"],
-                        log["kept"],
-                        log.get("platform")
-                    )
-                    for log in logs
-                ]
-                await conn.executemany(
-                    """
-                    INSERT INTO logs_runs (channel_id, pulled, kept, platform)
-                    VALUES ($1, $2, $3, $4)
-                    """,
-                    records
-                )
-            logger.info(f"✅ Successfully saved {len(logs)} log entries to logs_runs.")
+            async with (await self.get_pool()).acquire() as conn:
+                records = [_to_record(log) for log in logs]
+                async with conn.transaction():
+                    if len(records) >= COPY_THRESHOLD:
+                        await conn.copy_records_to_table(
+                            "logs_runs",
+                            records=records,
+                            columns=["channel_id", "pulled", "kept", "platform"]
+                        )
+                    else:
+                        # One round-trip for the whole batch instead of one per row
+                        channel_ids, pulled, kept, platforms = zip(*records)
+                        await conn.execute(
+                            INSERT_LOG_RUNS_SQL,
+                            list(channel_ids),
+                            list(pulled),
+                            list(kept),
+                            list(platforms)
+                        )
+            logger.info("✅ Successfully saved %d log entries to logs_runs.", len(logs))
         except Exception as e:
-            logger.error(f"❌ Failed to insert logs: {e}")
+            logger.error("❌ Failed to insert logs: %s", e)
             await send_error_to_telegram(f"❌ DB: Failed to insert logs: {e}")
             raise
\ No newline at end of file
@@ -0,0 +1,11 @@
+from dotenv import load_dotenv
+
+_DOTENV_LOADED = False
+
+
+def load_env() -> None:
+    """Load variables from .env once per process."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
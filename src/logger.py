@@ -1,8 +1,11 @@
 import logging
 import sys
+from typing import Dict
 
+_cache: Dict[str, logging.Logger] = {}
 
-def get_logger(name: str) -> logging.Logger:
+
+def _build(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     if not logger.handlers:
         logger.setLevel(logging.INFO)
@@ -17,3 +20,10 @@ def get_logger(name: str) -> logging.Logger:
         logger.propagate = False
     return logger
 
+
+def get_logger(name: str) -> logging.Logger:
+    # Configured loggers are memoized so repeat calls skip logging's lock
+    logger = _cache.get(name)
+    if logger is None:
+        logger = _cache.setdefault(name, _build(name))
+    return logger
@@ -1,6 +1,7 @@
 import re
+from functools import partial
 
-from cleantext import clean
+from cleantext.clean import fix_bad_unicode, normalize_whitespace, remove_emoji, replace_urls
 
 _LOW_VALUE_PHRASES = {
     "selamat pagi", "selamat siang", "selamat sore", "selamat malam",
@@ -11,25 +12,23 @@ _LOW_VALUE_PHRASES = {
 }
 
 
+# Same steps, in the same order, that clean() runs for the options we use
+# (fix_unicode, no_urls, no_emoji, no_line_breaks), composed once at import.
+_PIPELINE = (
+    fix_bad_unicode,
+    partial(replace_urls, replace_with=""),
+    remove_emoji,
+    partial(normalize_whitespace, no_line_breaks=True),
+)
+
+
 def filter_text(text: str) -> str:
-    cleaned_content = clean(
-        text,
-        fix_unicode=True,
-        to_ascii=False,
-        lower=False,
-        no_line_breaks=True,
-        normalize_whitespace=True,
-        no_emoji=True,
-        no_urls=True,
-        no_emails=False,
-        no_phone_numbers=False,
-        no_numbers=False,
-        no_digits=False,
-        no_currency_symbols=False,
-        no_punct=False,
-        replace_with_url="",
-        lang="en",
-    )
+    if text is None:
+        return ""
+
+    cleaned_content = str(text)
+    for step in _PIPELINE:
+        cleaned_content = step(cleaned_content)
 
     return cleaned_content
 
@@ -1,12 +1,15 @@
-import json
+import asyncio
 import os
+import re
+from typing import List, Optional
 
 import aiohttp
 import pandas as pd
-from dotenv import load_dotenv
+from src.config.env import load_env
+from src.http_client import get_session
 from src.logger import get_logger
 
-load_dotenv()
+load_env()
 
 logger = get_logger(__name__)
 
@@ -14,6 +17,15 @@ logger = get_logger(__name__)
 BOT_TOKEN = os.getenv("NOTIF_BOT_TOKEN")
 CHAT_ID = os.getenv("NOTIF_CHAT_ID")
 
+TELEGRAM_MESSAGE_LIMIT = 4096
+ERROR_DEBOUNCE_SECONDS = 0.5
+ERROR_HEADER = "🚨 *ERROR NOTIFICATION*\n\n"
+
+_MARKDOWN_ESCAPE_RE = re.compile(r"([_*`\[])")
+
+_err_queue: asyncio.Queue = asyncio.Queue()
+_err_drainer: Optional[asyncio.Task] = None
+
 
 async def send_dataframe_to_telegram(df: pd.DataFrame, name_data: str = "data") -> bool:
     """
@@ -32,70 +44,148 @@ async def send_dataframe_to_telegram(df: pd.DataFrame, name_data: str = "data")
 
     try:
         # Convert DataFrame to JSON bytes
-        data = df.to_dict(orient="records")
-        json_bytes = json.dumps(data, indent=4, ensure_ascii=False, default=str).encode("utf-8")
+        json_bytes = df.to_json(orient="records", date_format="iso", force_ascii=False, indent=2).encode("utf-8")
 
         # Prepare API URL
         url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendDocument"
 
-        # Send document via aiohttp
-        async with aiohttp.ClientSession() as session:
-            form = aiohttp.FormData()
-            form.add_field("chat_id", CHAT_ID)
-            form.add_field(
-                "document",
-                json_bytes,
-                filename=f"{name_data}.json",
-                content_type="application/json"
-            )
-            async with session.post(url, data=form) as response:
-                if response.status == 200:
-                    logger.info("✅ JSON file successfully sent to Telegram.")
-                    return True
-                else:
-                    error_text = await response.text()
-                    logger.error(f"❌ Failed to send file. Telegram API response: {error_text}")
-                    return False
+        # Send document via the shared aiohttp session
+        session = await get_session()
+        form = aiohttp.FormData()
+        form.add_field("chat_id", CHAT_ID)
+        form.add_field(
+            "document",
+            json_bytes,
+            filename=f"{name_data}.json",
+            content_type="application/json"
+        )
+        async with session.post(url, data=form) as response:
+            if response.status == 200:
+                logger.info("✅ JSON file successfully sent to Telegram.")
+                return True
+            else:
+                error_text = await response.text()
+                logger.error("❌ Failed to send file. Telegram API response: %s", error_text)
+                return False
 
     except Exception as e:
-        logger.error(f"❌ Exception while sending file DataFrame to Telegram: {e}")
+        logger.error("❌ Exception while sending file DataFrame to Telegram: %s", e)
         return False
 
 
 async def send_error_to_telegram(error_message: str) -> bool:
     """
-    Send an error notification to a Telegram chat using a bot.
+    Queue an error notification for a Telegram chat using a bot.
+
+    Errors arriving within ERROR_DEBOUNCE_SECONDS of each other are coalesced
+    and sent as a single message by a background task. Call
+    flush_error_notifications() before shutdown to deliver pending errors.
 
     Args:
         error_message (str): The error message to send.
 
     Returns:
-        bool: True if successful, False otherwise.
+        bool: True if the message was queued, False otherwise.
     """
+    global _err_drainer
+
     if BOT_TOKEN is None or CHAT_ID is None:
         logger.error("❌ Missing NOTIF_BOT_TOKEN or NOTIF_CHAT_ID in .env")
         return False
 
+    await _err_queue.put(error_message)
+    if _err_drainer is None or _err_drainer.done():
+        _err_drainer = asyncio.create_task(_drain_errors())
+    return True
+
+
+async def flush_error_notifications() -> None:
+    """Wait until all queued error notifications have been sent."""
+    if _err_drainer is not None and not _err_drainer.done():
+        await _err_drainer
+
+
+async def _drain_errors() -> None:
+    """Send queued errors in batches until the queue is empty."""
+    while not _err_queue.empty():
+        # Give bursts of errors a moment to accumulate
+        await asyncio.sleep(ERROR_DEBOUNCE_SECONDS)
+
+        messages = []
+        while not _err_queue.empty():
+            messages.append(_err_queue.get_nowait())
+
+        await _send_error_batch(messages)
+
+
+async def _send_error_batch(messages: List[str]) -> None:
+    """Post messages in as few requests as possible, retrying failed batches one message at a time."""
+    for chunk in _split_messages(messages, TELEGRAM_MESSAGE_LIMIT - len(ERROR_HEADER)):
+        if await _post_error("\n".join(chunk)) or len(chunk) == 1:
+            continue
+        for text in chunk:
+            await _post_error(text)
+
+
+def _escape_markdown(text: str) -> str:
+    """Escape the characters Telegram's legacy Markdown treats as entity markers."""
+    return _MARKDOWN_ESCAPE_RE.sub(r"\\\1", text)
+
+
+def _split_messages(messages: List[str], limit: int) -> List[List[str]]:
+    """
+    Escape messages and group them into chunks whose newline-joined length fits `limit`.
+
+    Messages are never split across chunks; a single oversized message is
+    truncated on its own.
+    """
+    chunks = []
+    current = []
+    size = 0
+    for message in messages:
+        if not message:
+            continue
+
+        text = _escape_markdown(message)
+        if len(text) > limit:
+            # Don't keep the backslash of an escape whose character is cut off
+            cut = limit - 1
+            if _MARKDOWN_ESCAPE_RE.match(text, cut):
+                cut -= 1
+            text = text[:cut] + "…"
+
+        if current and size + 1 + len(text) > limit:
+            chunks.append(current)
+            current, size = [], 0
+        size += len(text) + (1 if current else 0)
+        current.append(text)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def _post_error(text: str) -> bool:
+    """Post a single error notification to Telegram."""
     url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
     payload = {
         "chat_id": CHAT_ID,
-        "text": f"🚨 *ERROR NOTIFICATION*\n\n{error_message}",
+        "text": f"{ERROR_HEADER}{text}",
         "parse_mode": "Markdown"
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    logger.info("✅ Error notification sent to Telegram.")
-                    return True
-                else:
-                    error_text = await response.text()
-                    logger.error(f"❌ Failed to send error message. Telegram API response: {error_text}")
-                    return False
+        session = await get_session()
+        async with session.post(url, json=payload) as response:
+            if response.status == 200:
+                logger.info("✅ Error notification sent to Telegram.")
+                return True
+            else:
+                error_text = await response.text()
+                logger.error("❌ Failed to send error message. Telegram API response: %s", error_text)
+                return False
 
     except Exception as e:
-        logger.error(f"❌ Exception while sending error to Telegram: {e}")
+        logger.error("❌ Exception while sending error to Telegram: %s", e)
         return False
 
 
@@ -121,16 +211,16 @@ async def send_notify_telegram(message: str) -> bool:
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    logger.info("✅ Message notification sent to Telegram.")
-                    return True
-                else:
-                    error_text = await response.text()
-                    logger.error(f"❌ Failed to send error message. Telegram API response: {error_text}")
-                    return False
+        session = await get_session()
+        async with session.post(url, json=payload) as response:
+            if response.status == 200:
+                logger.info("✅ Message notification sent to Telegram.")
+                return True
+            else:
+                error_text = await response.text()
+                logger.error("❌ Failed to send error message. Telegram API response: %s", error_text)
+                return False
 
     except Exception as e:
-        logger.error(f"❌ Exception while sending error to Telegram: {e}")
+        logger.error("❌ Exception while sending error to Telegram: %s", e)
         return False
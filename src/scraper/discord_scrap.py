@@ -3,14 +3,14 @@ import asyncio
 import aiohttp
 import pandas as pd
 from datetime import datetime, timezone, timedelta
-from dotenv import load_dotenv
+from src.config.env import load_env
 
 from src.logger import get_logger
 from src.types import ScrapeStats
 from src.notification import send_error_to_telegram
 from src.normalization import filter_text, is_low_value_message
 
-load_dotenv()
+load_env()
 
 
 class DiscordScraper:
@@ -62,7 +62,7 @@ class DiscordScraper:
                             batch = await resp.json()
                         elif resp.status == 429:
                             retry_after = int(resp.headers.get("Retry-After", 1))
-                            self.logger.warning(f"⚠️ Rate limited. Waiting {retry_after} seconds...")
+                            self.logger.warning("⚠️ Rate limited. Waiting %d seconds...", retry_after)
                             await asyncio.sleep(retry_after)
                             continue
                         elif resp.status == 401:
@@ -77,12 +77,12 @@ class DiscordScraper:
                         else:
                             error_text = await resp.text()
                             await send_error_to_telegram(f"⚠️ HTTP {resp.status}: {error_text[:200]}")
-                            self.logger.error(f"⚠️ HTTP {resp.status}: {error_text[:200]}")
+                            self.logger.error("⚠️ HTTP %d: %s", resp.status, error_text[:200])
                             break
 
                 except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                     retry_count += 1
-                    self.logger.warning(f"🔄 Network error (attempt {retry_count}/{max_retries}): {e}")
+                    self.logger.warning("🔄 Network error (attempt %d/%d): %s", retry_count, max_retries, e)
                     if retry_count >= max_retries:
                         await send_error_to_telegram("❌ Max retries reached. Stopping fetch.")
                         self.logger.error("❌ Max retries reached. Stopping fetch.")
@@ -148,7 +148,7 @@ class DiscordScraper:
         total_pulled = len(all_messages)
         total_kept = len(filtered_data)
 
-        self.logger.info(f"📊 [Discord] Pulled: {total_pulled} | Kept: {total_kept}")
+        self.logger.info("📊 [Discord] Pulled: %d | Kept: %d", total_pulled, total_kept)
         df = pd.DataFrame(filtered_data)
         df.sort_values("timestamp").drop_duplicates(subset=["text"], keep="last")
         return df, ScrapeStats(channel_id=channel_id, platform="discord", pulled=total_pulled, kept=total_kept)
@@ -1,19 +1,54 @@
 import os
-from datetime import datetime, timezone
 
 import pandas as pd
 import aiohttp
-from dotenv import load_dotenv
+import orjson
+from src.config.env import load_env
 
+from src.http_client import get_session
 from src.logger import get_logger
 from src.types import ScrapeStats
-from src.utils import is_valid_endpoint_path, tweet_id_to_timestamp, get_endpoint_name
+from src.utils import is_valid_endpoint_path, tweet_ids_to_timestamps, get_endpoint_name
 from src.notification import send_error_to_telegram
-from urllib.parse import urljoin
 
-load_dotenv()
+load_env()
+
+# Shared result for error/empty responses; returned as-is, never mutated
+_EMPTY_DF = pd.DataFrame({
+    "id": pd.Series(dtype="str"),
+    "text": pd.Series(dtype="str"),
+    "timestamp": pd.Series(dtype="datetime64[ns, UTC]"),
+    "author": pd.Series(dtype="str"),
+    "platform": pd.Series(dtype="str"),
+    "channel_id": pd.Series(dtype="str"),
+    "links": pd.Series(dtype="object")
+})
+
 
 class ElfaScraper:
+    _BASE_URL = "https://api.elfa.ai/v2/data"
+    # Fail fast on unreachable or stalled connections instead of waiting out the total
+    _TIMEOUT = aiohttp.ClientTimeout(total=30, sock_connect=5, sock_read=15)
+
+    # Where each endpoint keeps its items and which fields map to our columns.
+    # timestamps_fn receives all kept tweet IDs at once and returns the timestamp column.
+    _ENDPOINT_SPECS = {
+        "event-summary": {
+            "container": ("data",),
+            "ids_key": "tweetIds",
+            "text_key": "summary",
+            "links_key": "sourceLinks",
+            "timestamps_fn": lambda tweet_ids: pd.Timestamp.now(tz="UTC"),
+        },
+        "trending-narratives": {
+            "container": ("data", "trending_narratives"),
+            "ids_key": "tweet_ids",
+            "text_key": "narrative",
+            "links_key": "source_links",
+            "timestamps_fn": tweet_ids_to_timestamps,
+        },
+    }
+
     def __init__(self):
         """
         Initialize the Elfa API scraper.
@@ -22,8 +57,61 @@ class ElfaScraper:
         self.api_key = os.getenv("ELFA_API_KEY")
         if not self.api_key:
             raise ValueError("ELFA_API_KEY not found in .env")
+        self._headers = {
+            "Accept": "application/json",
+            "x-elfa-api-key": self.api_key
+        }
         self.logger = get_logger(self.__class__.__name__)
 
+    def _build_records(self, raw_data, spec: dict, path_url: str) -> tuple[int, pd.DataFrame]:
+        """
+        Walk spec["container"] to the item list and build the result DataFrame.
+
+        Returns:
+            tuple[int, pd.DataFrame]: Number of items pulled and the kept records.
+
+        Raises:
+            KeyError: If a container key is missing from the response.
+        """
+        items = raw_data
+        for key in spec["container"]:
+            if not (isinstance(items, dict) and key in items):
+                raise KeyError(key)
+            items = items[key]
+
+        ids_key, text_key, links_key = spec["ids_key"], spec["text_key"], spec["links_key"]
+
+        ids, texts, authors, links = [], [], [], []
+        for item in items:
+            tweet_ids = item.get(ids_key, [])
+            if not tweet_ids:
+                continue
+
+            tweet_id = tweet_ids[0]
+
+            ids.append(tweet_id)
+            texts.append(str(item.get(text_key, "")).strip())
+            authors.append(f"elfa_{tweet_id}")
+            links.append([
+                link.strip() for link in item.get(links_key, [])
+                if isinstance(link, str) and link.strip()
+            ])
+
+        if not ids:
+            return len(items), _EMPTY_DF
+
+        # Scalars are expanded to full columns by the constructor
+        df = pd.DataFrame({
+            "id": ids,
+            "text": texts,
+            "timestamp": spec["timestamps_fn"](ids),
+            "author": authors,
+            "platform": "elfa",
+            "channel_id": path_url,
+            "links": links
+        })
+        return len(items), df
+
     async def fetch_endpoint(self, path_url: str) -> tuple[pd.DataFrame, ScrapeStats]:
         """
         Accepts only the path + query part, e.g.:
@@ -42,148 +130,79 @@ class ElfaScraper:
             error_msg = f"❌ Invalid Elfa endpoint: {e}"
             await send_error_to_telegram(error_msg)
             self.logger.error(error_msg)
-            empty_df = pd.DataFrame(columns=["id", "text", "timestamp", "author", "platform", "links"])
-            return empty_df, ScrapeStats(channel_id=path_url, platform="elfa", pulled=0, kept=0)
+            return _EMPTY_DF, ScrapeStats(channel_id=path_url, platform="elfa", pulled=0, kept=0)
 
         title_elfa = get_endpoint_name(path_url)
 
-        elfa_base_url = "https://api.elfa.ai/v2/data"
+        full_url = f"{self._BASE_URL}/{path_url.lstrip('/')}"
 
-        full_url = urljoin(elfa_base_url.rstrip("/") + "/", path_url.lstrip("/"))
+        headers = self._headers
+        empty_df = _EMPTY_DF
 
-        headers = {
-            "Accept": "application/json",
-            "x-elfa-api-key": self.api_key
-        }
-        empty_df = pd.DataFrame(columns=["id", "text", "timestamp", "author", "platform", "links"])
-
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(
-                        full_url,
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=30)
-                ) as resp:
-
-                    if resp.status != 200:
-                        error_text = (await resp.text())[:200]
-                        error_msg = f"❌ Elfa {title_elfa}: HTTP {resp.status} – {error_text}"
-                        await send_error_to_telegram(error_msg)
-                        self.logger.error(error_msg)
-                        return empty_df, ScrapeStats(channel_id=title_elfa,
-                                                     platform="elfa",
-                                                     pulled=0,
-                                                     kept=0,
-                                                     success=False,
-                                                     error=error_text)
-
-                    try:
-                        raw_data = await resp.json()
-                    except Exception as e:
-                        error_msg = f"❌ Failed to parse JSON from Elfa {title_elfa}: {e}"
-                        await send_error_to_telegram(error_msg)
-                        self.logger.error(error_msg)
-                        return empty_df, ScrapeStats(channel_id=title_elfa,
-                                                     platform="elfa",
-                                                     pulled=0, kept=0,
-                                                     success=False,
-                                                     error=str(e))
-
-                    # Parse based on endpoint type
-                    records = []
-                    if endpoint_type == "event-summary":
-                        if not (isinstance(raw_data, dict) and "data" in raw_data):
-                            error_msg = f"⚠️ Missing 'data' field in event-summary response"
-                            await send_error_to_telegram(error_msg)
-                            self.logger.warning(error_msg)
-                            return empty_df, ScrapeStats(channel_id=title_elfa,
-                                                         platform="elfa",
-                                                         pulled=0, kept=0,
-                                                         success=False,
-                                                         error=error_msg)
-
-                        items = raw_data["data"]
-                        total_pulled = len(items)
-
-                        for item in items:
-                            tweet_ids = item.get("tweetIds", [])
-                            if not tweet_ids:
-                                continue
-
-                            tweet_id = tweet_ids[0]
-
-                            timestamp = datetime.now(timezone.utc)
-
-                            record = {
-                                "id": tweet_id,
-                                "text": str(item.get("summary", "")).strip(),
-                                "timestamp": timestamp,
-                                "author": f"elfa_{tweet_id}",
-                                "platform": "elfa",
-                                "channel_id": path_url,
-                                "links": [
-                                    link.strip() for link in item.get("sourceLinks", [])
-                                    if isinstance(link, str) and link.strip()
-                                ]
-                            }
-                            records.append(record)
-
-                    elif endpoint_type == "trending-narratives":
-                        if not (isinstance(raw_data, dict) and "data" in raw_data and "trending_narratives" in raw_data[
-                            "data"]):
-                            error_msg = f"⚠️ Missing 'trending_narratives' in response"
-                            await send_error_to_telegram(error_msg)
-                            self.logger.warning(error_msg)
-                            return empty_df, ScrapeStats(channel_id=title_elfa,
-                                                         platform="elfa",
-                                                         pulled=0,
-                                                         kept=0,
-                                                         success=False,
-                                                         error=error_msg)
-
-                        narratives = raw_data["data"]["trending_narratives"]
-                        total_pulled = len(narratives)
-
-                        for item in narratives:
-                            tweet_ids = item.get("tweet_ids", [])
-                            if not tweet_ids:
-                                continue
-
-                            tweet_id = tweet_ids[0]
-
-                            timestamp = tweet_id_to_timestamp(tweet_id)
-
-                            record = {
-                                "id": tweet_id,
-                                "text": str(item.get("narrative", "")).strip(),
-                                "timestamp": timestamp,
-                                "author": f"elfa_{tweet_id}",
-                                "platform": "elfa",
-                                "channel_id": path_url,
-                                "links": [
-                                    link.strip() for link in item.get("source_links", [])
-                                    if isinstance(link, str) and link.strip()
-                                ]
-                            }
-                            records.append(record)
-
-                    # Finalize
-                    total_kept = len(records)
-                    self.logger.info(f"📊 [Elfa] Pulled: {total_pulled} | Kept: {total_kept}")
-
-                    df = pd.DataFrame(records) if records else empty_df
-                    return df, ScrapeStats(channel_id=title_elfa,
-                                           platform="elfa",
-                                           pulled=total_pulled,
-                                           kept=total_kept)
-
-            except Exception as e:
-                error_msg = f"💥 Elfa {title_elfa}: Unexpected error – {e}"
-                await send_error_to_telegram(error_msg)
-                self.logger.error(error_msg)
-                return empty_df, ScrapeStats(channel_id=title_elfa,
-                                                         platform="elfa",
-                                                         pulled=0,
-                                                         kept=0,
-                                                         success=False,
-                                                         error=error_msg)
\ No newline at end of file
+        session = await get_session()
+        try:
+            async with session.get(
+                    full_url,
+                    headers=headers,
+                    timeout=self._TIMEOUT
+            ) as resp:
+
+                if resp.status != 200:
+                    error_text = (await resp.text())[:200]
+                    error_msg = f"❌ Elfa {title_elfa}: HTTP {resp.status} – {error_text}"
+                    await send_error_to_telegram(error_msg)
+                    self.logger.error(error_msg)
+                    return empty_df, ScrapeStats(channel_id=title_elfa,
+                                                 platform="elfa",
+                                                 pulled=0,
+                                                 kept=0,
+                                                 success=False,
+                                                 error=error_text)
+
+                try:
+                    raw_data = orjson.loads(await resp.read())
+                except Exception as e:
+                    error_msg = f"❌ Failed to parse JSON from Elfa {title_elfa}: {e}"
+                    await send_error_to_telegram(error_msg)
+                    self.logger.error(error_msg)
+                    return empty_df, ScrapeStats(channel_id=title_elfa,
+                                                 platform="elfa",
+                                                 pulled=0, kept=0,
+                                                 success=False,
+                                                 error=str(e))
+
+                # Parse based on endpoint type
+                try:
+                    total_pulled, df = self._build_records(raw_data,
+                                                           self._ENDPOINT_SPECS[endpoint_type],
+                                                           path_url)
+                except KeyError as e:
+                    error_msg = f"⚠️ Missing {e} in {endpoint_type} response"
+                    await send_error_to_telegram(error_msg)
+                    self.logger.warning(error_msg)
+                    return empty_df, ScrapeStats(channel_id=title_elfa,
+                                                 platform="elfa",
+                                                 pulled=0,
+                                                 kept=0,
+                                                 success=False,
+                                                 error=error_msg)
+
+                # Finalize
+                total_kept = len(df)
+                self.logger.info("📊 [Elfa] Pulled: %d | Kept: %d", total_pulled, total_kept)
+
+                return df, ScrapeStats(channel_id=title_elfa,
+                                       platform="elfa",
+                                       pulled=total_pulled,
+                                       kept=total_kept)
+
+        except Exception as e:
+            error_msg = f"💥 Elfa {title_elfa}: Unexpected error – {e}"
+            await send_error_to_telegram(error_msg)
+            self.logger.error(error_msg)
+            return empty_df, ScrapeStats(channel_id=title_elfa,
+                                         platform="elfa",
+                                         pulled=0,
+                                         kept=0,
+                                         success=False,
+                                         error=error_msg)
@@ -6,14 +6,14 @@ from getpass import getpass
 import pandas as pd
 from telethon import TelegramClient
 from telethon.tl.types import PeerUser, MessageEntityTextUrl
-from dotenv import load_dotenv
+from src.config.env import load_env
 
 from src.logger import get_logger
 from src.types import ScrapeStats
 from src.notification import send_error_to_telegram
 from src.normalization import filter_text, is_low_value_message
 
-load_dotenv()
+load_env()
 
 
 class TelegramScraper:
@@ -149,15 +149,15 @@ class TelegramScraper:
                 df = df.sort_values("timestamp").drop_duplicates(subset=["text"], keep="last")
 
             total_kept = len(df)
-            self.logger.info(f"✅ Successfully scraped {len(df)} messages after filtering.")
-            self.logger.info(f"📊 [Telegram] Pulled: {total_pulled} | Kept: {total_kept}")
+            self.logger.info("✅ Successfully scraped %d messages after filtering.", len(df))
+            self.logger.info("📊 [Telegram] Pulled: %d | Kept: %d", total_pulled, total_kept)
 
             return df, ScrapeStats(channel_id=group_id, platform="telegram", pulled=total_pulled, kept=total_kept)
 
 
         except Exception as e:
             await send_error_to_telegram(f"❌ Error during scraping: {e}")
-            self.logger.error(f"❌ Error during scraping: {e}")
+            self.logger.error("❌ Error during scraping: %s", e)
             return (pd.DataFrame(columns=["id", "text", "timestamp", "author", "channel_id", "platform", "links"]),
                     ScrapeStats(channel_id=group_id, platform="telegram", pulled=0, kept=0))
 
@@ -1,11 +1,13 @@
-from typing import TypedDict, NotRequired, Optional
+from dataclasses import dataclass
+from typing import Optional
 import pandas as pd
 
 
-class ScrapeStats(TypedDict):
+@dataclass(slots=True)
+class ScrapeStats:
     channel_id: str
     platform: str
     pulled: int
     kept: int
-    success: NotRequired[Optional[bool]]
-    error: NotRequired[Optional[str]]
+    success: Optional[bool] = None
+    error: Optional[str] = None
@@ -1,5 +1,6 @@
 import asyncio
 
+import numpy as np
 import pandas as pd
 from typing import List, Union, Optional
 from datetime import datetime, timezone
@@ -13,6 +14,8 @@ from src.types import ScrapeStats
 
 logger = get_logger(__name__)
 
+TWITTER_EPOCH_MS = 1288834974657
+
 
 def get_endpoint_name(path_and_query: str) -> str:
     """
@@ -69,7 +72,7 @@ async def scrape_all_sources(
                     all_dfs.append(df_discord)
             except Exception as e:
                 await send_error_to_telegram(f"❌ Discord {channel_id} error: {str(e)}")
-                logger.error(f"❌ Discord {channel_id} error: {str(e)}")
+                logger.error("❌ Discord %s error: %s", channel_id, e)
                 all_stats.append(ScrapeStats(channel_id=channel_id,
                                              platform="discord",
                                              pulled=0,
@@ -92,7 +95,7 @@ async def scrape_all_sources(
                     all_dfs.append(df_telegram)
             except Exception as e:
                 await send_error_to_telegram(f"❌ Telegram {group_id} error: {str(e)}")
-                logger.error(f"❌ Telegram {group_id} error: {str(e)}")
+                logger.error("❌ Telegram %s error: %s", group_id, e)
                 all_stats.append(ScrapeStats(channel_id=group_id,
                                              platform="telegram",
                                              pulled=0,
@@ -113,7 +116,7 @@ async def scrape_all_sources(
                     all_dfs.append(df_elfa)
             except Exception as e:
                 await send_error_to_telegram(f"❌ Elfa {title_elfa} error: {str(e)}")
-                logger.error(f"❌ Elfa {title_elfa} error: {str(e)}")
+                logger.error("❌ Elfa %s error: %s", title_elfa, e)
                 all_stats.append(ScrapeStats(channel_id=title_elfa,
                                              platform="elfa",
                                              pulled=0,
@@ -142,7 +145,7 @@ async def scrape_all_sources(
             .sort_values("timestamp", ascending=False)
             .reset_index(drop=True)
         )
-        logger.info(f"✅ Total combined messages: {len(combined)}")
+        logger.info("✅ Total combined messages: %d", len(combined))
         return combined, all_stats
     else:
         await send_error_to_telegram("⚠️ No messages collected from any source.")
@@ -169,8 +172,6 @@ def is_valid_endpoint_path(path_and_query: str) -> str:
 
 
 def tweet_id_to_timestamp(tweet_id: str) -> datetime:
-    TWITTER_EPOCH_MS = 1288834974657
-
     try:
         tweet_id_int = int(tweet_id)
     except (ValueError, TypeError):
@@ -178,3 +179,17 @@ def tweet_id_to_timestamp(tweet_id: str) -> datetime:
 
     timestamp_ms = (tweet_id_int >> 22) + TWITTER_EPOCH_MS
     return datetime.fromtimestamp(timestamp_ms / 1000.0, tz=timezone.utc)
+
+
+def tweet_ids_to_timestamps(tweet_ids: List[str]) -> pd.DatetimeIndex:
+    """
+    Vectorized tweet_id_to_timestamp for a batch of tweet IDs.
+
+    Falls back to the scalar conversion if any ID is not a valid integer.
+    """
+    try:
+        ids = np.array(tweet_ids, dtype=np.int64)
+    except (ValueError, TypeError, OverflowError):
+        return pd.DatetimeIndex([tweet_id_to_timestamp(tweet_id) for tweet_id in tweet_ids])
+
+    return pd.to_datetime((ids >> 22) + TWITTER_EPOCH_MS, unit="ms", utc=True)